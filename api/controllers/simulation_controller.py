@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict
 from bson import ObjectId
 from domain.services.simulation_service import SimulationService
-from infrastructure.database import Database
+from infrastructure import database as db
 from domain.services.chat_service import ChatService
 from api.schemas.requests import (CreateSimulationRequest,
                                   UpdateSimulationRequest,
@@ -23,7 +23,6 @@ class SimulationController:
     def __init__(self):
         self.service = SimulationService()
         self.chat_service = ChatService()
-        self.db = Database()
 
     async def create_simulation(
             self,
@@ -53,7 +52,8 @@ class SimulationController:
 
         result = await self.service.update_simulation(sim_id, request)
         return UpdateSimulationResponse(id=result["id"],
-                                        status=result["status"])
+                                        status=result["status"],
+                                        noop=result.get("noop", False))
 
     async def start_audio_simulation_preview(
         self, request: StartAudioSimulationPreviewRequest
@@ -79,7 +79,7 @@ class SimulationController:
         if request.message == "":
             # Get simulation document
             sim_id_object = ObjectId(request.sim_id)
-            simulation = await self.db.simulations.find_one(
+            simulation = await db.simulations.find_one(
                 {"_id": sim_id_object})
 
             if not simulation:
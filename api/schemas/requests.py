@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from functools import cached_property
+from pydantic import AliasGenerator, BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
 
 
 class TrainingDataRequest(BaseModel):
@@ -43,7 +45,13 @@ class ScriptSentence(BaseModel):
     keywords: list[str]
 
 
-class SimulationLevel(BaseModel):
+class SubDocument(BaseModel):
+    """Nested settings stored on a document under camelCase keys"""
+    model_config = ConfigDict(alias_generator=AliasGenerator(
+        serialization_alias=to_camel))
+
+
+class SimulationLevel(SubDocument):
     is_enabled: bool = False
     enable_practice: bool = False
     hide_agent_script: bool = False
@@ -56,13 +64,13 @@ class SimulationLevel(BaseModel):
     ai_powered_pauses_and_feedback: bool = False
 
 
-class SimulationScoringMetrics(BaseModel):
+class SimulationScoringMetrics(SubDocument):
     is_enabled: bool = False
     keyword_score: int = 0
     click_score: int = 0
 
 
-class SimulationPractice(BaseModel):
+class SimulationPractice(SubDocument):
     is_unlimited: bool = False
     pre_requisite_limit: int = 0
 
@@ -76,6 +84,12 @@ class CreateSimulationRequest(BaseModel):
     script: list[ScriptSentence]
     tags: list[str]
 
+    @cached_property
+    def conversation(self) -> str:
+        """Script rendered as 'role: sentence' lines for prompt generation"""
+        return "\n".join(f"{s.role}: {s.script_sentence}"
+                         for s in self.script)
+
 
 class UpdateSimulationRequest(BaseModel):
     user_id: str
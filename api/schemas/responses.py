@@ -30,6 +30,7 @@ class CreateSimulationResponse(BaseModel):
 class UpdateSimulationResponse(BaseModel):
     id: str
     status: str
+    noop: bool = False
 
 
 class ListVoicesResponse(BaseModel):
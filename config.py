@@ -1,56 +1,91 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from dotenv import load_dotenv
 
-load_dotenv()
-
-# Provide default values if environment variables are not set
-MONGO_URI = os.getenv("mongo-url", "mongodb://localhost:27017")
-DB_NAME = os.getenv("db-name",
-                    "everai_simulator")  # Default database name if not set
-DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY",
-                             "90b109a0bc690efde72b6e9da892d9371885cb8f")
-RETELL_API_KEY = os.getenv("RETELL_API_KEY",
-                           "key_c98334da2d625bae2d5c9a24d33f")
-
-# Azure OpenAI Configuration
-AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME",
-                                         "gpt-4o-simulator")
-AZURE_OPENAI_KEY = os.getenv(
-    "AZURE_OPENAI_KEY",
-    "9cBKHrEKbc07HRGSQzLaqmB0YvSQLCrDKWRkQBHBPyvAhfrdfCrTJQQJ99BBACYeBjFXJ3w3AAABACOGWBtj"
-)
-AZURE_OPENAI_BASE_URL = os.getenv("AZURE_OPENAI_BASE_URL",
-                                  "https://everai-simulator.openai.azure.com")
-
-# Validate configuration
-if not MONGO_URI:
-    raise ValueError(
-        "MongoDB URI not set. Please set 'mongo-url' environment variable.")
-
-if not isinstance(DB_NAME, str):
-    raise ValueError("Database name must be a string")
-
-if not DEEPGRAM_API_KEY:
-    raise ValueError(
-        "Deepgram API key not set. Please set DEEPGRAM_API_KEY environment variable."
-    )
-
-if not RETELL_API_KEY:
-    raise ValueError(
-        "Retell API key not set. Please set RETELL_API_KEY environment variable."
-    )
-
-if not AZURE_OPENAI_DEPLOYMENT_NAME:
-    raise ValueError(
-        "Azure OpenAI deployment name not set. Please set AZURE_OPENAI_DEPLOYMENT_NAME environment variable."
-    )
-
-if not AZURE_OPENAI_KEY:
-    raise ValueError(
-        "Azure OpenAI key not set. Please set AZURE_OPENAI_KEY environment variable."
-    )
-
-if not AZURE_OPENAI_BASE_URL:
-    raise ValueError(
-        "Azure OpenAI base URL not set. Please set AZURE_OPENAI_BASE_URL environment variable."
-    )
+_loaded = False
+
+
+@dataclass(frozen=True)
+class Settings:
+    mongo_uri: str
+    db_name: str
+    deepgram_api_key: str
+    retell_api_key: str
+    azure_openai_deployment_name: str
+    azure_openai_key: str
+    azure_openai_base_url: str
+
+
+def _load_env() -> None:
+    """Parse .env at most once per process"""
+    global _loaded
+    if not _loaded:
+        load_dotenv(override=False)
+        _loaded = True
+
+
+def _validate(settings: Settings) -> None:
+    if not settings.mongo_uri:
+        raise ValueError(
+            "MongoDB URI not set. Please set 'mongo-url' environment variable."
+        )
+
+    if not isinstance(settings.db_name, str):
+        raise ValueError("Database name must be a string")
+
+    if not settings.deepgram_api_key:
+        raise ValueError(
+            "Deepgram API key not set. Please set DEEPGRAM_API_KEY environment variable."
+        )
+
+    if not settings.retell_api_key:
+        raise ValueError(
+            "Retell API key not set. Please set RETELL_API_KEY environment variable."
+        )
+
+    if not settings.azure_openai_deployment_name:
+        raise ValueError(
+            "Azure OpenAI deployment name not set. Please set AZURE_OPENAI_DEPLOYMENT_NAME environment variable."
+        )
+
+    if not settings.azure_openai_key:
+        raise ValueError(
+            "Azure OpenAI key not set. Please set AZURE_OPENAI_KEY environment variable."
+        )
+
+    if not settings.azure_openai_base_url:
+        raise ValueError(
+            "Azure OpenAI base URL not set. Please set AZURE_OPENAI_BASE_URL environment variable."
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load and validate configuration once; later calls return the cached Settings"""
+    _load_env()
+
+    # Provide default values if environment variables are not set
+    settings = Settings(
+        mongo_uri=os.getenv("mongo-url", "mongodb://localhost:27017"),
+        db_name=os.getenv(
+            "db-name", "everai_simulator"),  # Default database name if not set
+        deepgram_api_key=os.getenv("DEEPGRAM_API_KEY",
+                                   "90b109a0bc690efde72b6e9da892d9371885cb8f"),
+        retell_api_key=os.getenv("RETELL_API_KEY",
+                                 "key_c98334da2d625bae2d5c9a24d33f"),
+
+        # Azure OpenAI Configuration
+        azure_openai_deployment_name=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME",
+                                               "gpt-4o-simulator"),
+        azure_openai_key=os.getenv(
+            "AZURE_OPENAI_KEY",
+            "9cBKHrEKbc07HRGSQzLaqmB0YvSQLCrDKWRkQBHBPyvAhfrdfCrTJQQJ99BBACYeBjFXJ3w3AAABACOGWBtj"
+        ),
+        azure_openai_base_url=os.getenv(
+            "AZURE_OPENAI_BASE_URL",
+            "https://everai-simulator.openai.azure.com"))
+
+    # Validate configuration
+    _validate(settings)
+    return settings
@@ -1,6 +1,6 @@
 from typing import Dict, List
 from datetime import datetime
-from infrastructure.database import Database
+from infrastructure import database as db
 from api.schemas.requests import CreateAssignmentRequest
 from api.schemas.responses import AssignmentData
 from fastapi import HTTPException
@@ -8,9 +8,6 @@ from fastapi import HTTPException
 
 class AssignmentService:
 
-    def __init__(self):
-        self.db = Database()
-
     async def create_assignment(self,
                                 request: CreateAssignmentRequest) -> Dict:
         """Create a new assignment"""
@@ -31,7 +28,7 @@ class AssignmentService:
             }
 
             # Insert into database
-            result = await self.db.assignments.insert_one(assignment_doc)
+            result = await db.assignments.insert_one(assignment_doc)
 
             return {"id": str(result.inserted_id), "status": "success"}
 
@@ -42,7 +39,7 @@ class AssignmentService:
     async def fetch_assignments(self) -> List[AssignmentData]:
         """Fetch all assignments"""
         try:
-            cursor = self.db.assignments.find({})
+            cursor = db.assignments.find({})
             assignments = []
 
             async for doc in cursor:
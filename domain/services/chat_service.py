@@ -6,28 +6,27 @@ from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_prompt_execution_settings import (
     AzureChatPromptExecutionSettings, )
-from config import (AZURE_OPENAI_DEPLOYMENT_NAME, AZURE_OPENAI_KEY,
-                    AZURE_OPENAI_BASE_URL)
-from infrastructure.database import Database
+from config import get_settings
+from infrastructure import database as db
 from fastapi import HTTPException
 
 
 class ChatService:
 
     def __init__(self):
-        self.db = Database()
+        settings = get_settings()
 
         # Initialize Azure OpenAI chat completion
         self.kernel = Kernel()
         self.chat_completion = AzureChatCompletion(
             service_id="azure_gpt4",
-            deployment_name=AZURE_OPENAI_DEPLOYMENT_NAME,
-            endpoint=AZURE_OPENAI_BASE_URL,
-            api_key=AZURE_OPENAI_KEY)
+            deployment_name=settings.azure_openai_deployment_name,
+            endpoint=settings.azure_openai_base_url,
+            api_key=settings.azure_openai_key)
         self.kernel.add_service(self.chat_completion)
         self.execution_settings = AzureChatPromptExecutionSettings(
             service_id="azure_gpt4",
-            ai_model_id=AZURE_OPENAI_DEPLOYMENT_NAME,
+            ai_model_id=settings.azure_openai_deployment_name,
             temperature=0.7,
             top_p=1.0,
             max_tokens=2000)
@@ -40,7 +39,7 @@ class ChatService:
         try:
             # Get simulation
             sim_id_object = ObjectId(sim_id)
-            simulation = await self.db.simulations.find_one(
+            simulation = await db.simulations.find_one(
                 {"_id": sim_id_object})
 
             if not simulation:
@@ -82,7 +81,7 @@ class ChatService:
             # }
 
             # # Insert into database
-            # result = await self.db.chat_sessions.insert_one(chat_doc)
+            # result = await db.chat_sessions.insert_one(chat_doc)
 
             return {"response": str(response) if response else ""}
 
@@ -97,7 +96,7 @@ class ChatService:
         try:
             # Get chat session
             chat_id_object = ObjectId(chat_id)
-            chat_session = await self.db.chat_sessions.find_one(
+            chat_session = await db.chat_sessions.find_one(
                 {"_id": chat_id_object})
 
             if not chat_session:
@@ -126,7 +125,7 @@ class ChatService:
             history.add_assistant_message(str(response))
 
             # Update chat session
-            await self.db.chat_sessions.update_one({"_id": chat_id_object}, {
+            await db.chat_sessions.update_one({"_id": chat_id_object}, {
                 "$set": {
                     "history": [msg.dict() for msg in history.messages],
                     "lastModifiedAt": datetime.utcnow()
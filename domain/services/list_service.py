@@ -1,19 +1,16 @@
 from typing import Dict, List
 from bson import ObjectId
-from infrastructure.database import Database
+from infrastructure import database as db
 from api.schemas.responses import ListItemData
 from fastapi import HTTPException
 
 
 class ListService:
 
-    def __init__(self):
-        self.db = Database()
-
     async def list_training_plans(self, user_id: str) -> List[ListItemData]:
         """List all training plans with summary information"""
         try:
-            cursor = self.db.training_plans.find({})
+            cursor = db.training_plans.find({})
             training_plans = []
 
             async for doc in cursor:
@@ -25,7 +22,7 @@ class ListService:
                     elif obj["type"] == "module":
                         # Get module's simulations
                         try:
-                            module = await self.db.modules.find_one(
+                            module = await db.modules.find_one(
                                 {"_id": ObjectId(obj["id"])})
                             if module:
                                 total_sims += len(
@@ -50,7 +47,7 @@ class ListService:
     async def list_modules(self, user_id: str) -> List[ListItemData]:
         """List all modules with summary information"""
         try:
-            cursor = self.db.modules.find({})
+            cursor = db.modules.find({})
             modules = []
 
             async for doc in cursor:
@@ -73,7 +70,7 @@ class ListService:
         """List all published simulations with summary information"""
         try:
             # Only find simulations with status "published"
-            cursor = self.db.simulations.find({"status": "published"})
+            cursor = db.simulations.find({"status": "published"})
             simulations = []
 
             async for doc in cursor:
@@ -1,7 +1,7 @@
 from typing import Dict, List
 from datetime import datetime
 from bson import ObjectId
-from infrastructure.database import Database
+from infrastructure import database as db
 from api.schemas.requests import CreateModuleRequest
 from api.schemas.responses import ModuleData
 from fastapi import HTTPException
@@ -9,15 +9,12 @@ from fastapi import HTTPException
 
 class ModuleService:
 
-    def __init__(self):
-        self.db = Database()
-
     async def create_module(self, request: CreateModuleRequest) -> Dict:
         """Create a new module"""
         try:
             # Validate simulation IDs
             for sim_id in request.simulations:
-                sim = await self.db.simulations.find_one(
+                sim = await db.simulations.find_one(
                     {"_id": ObjectId(sim_id)})
                 if not sim:
                     raise HTTPException(
@@ -36,7 +33,7 @@ class ModuleService:
             }
 
             # Insert into database
-            result = await self.db.modules.insert_one(module_doc)
+            result = await db.modules.insert_one(module_doc)
 
             return {"id": str(result.inserted_id), "status": "success"}
 
@@ -49,7 +46,7 @@ class ModuleService:
     async def fetch_modules(self, user_id: str) -> List[ModuleData]:
         """Fetch all modules"""
         try:
-            cursor = self.db.modules.find({})
+            cursor = db.modules.find({})
             modules = []
 
             async for doc in cursor:
@@ -57,7 +54,7 @@ class ModuleService:
                 total_estimated_time = 0
                 for sim_id in doc.get("simulationIds", []):
                     try:
-                        sim = await self.db.simulations.find_one(
+                        sim = await db.simulations.find_one(
                             {"_id": ObjectId(sim_id)})
                         if sim and "estimatedTimeToAttemptInMins" in sim:
                             total_estimated_time += sim[
@@ -1,12 +1,12 @@
 from fastapi import UploadFile, HTTPException
 from typing import List, Dict
 import json
+import logging
 import aiohttp
 import PyPDF2
 import io
 import docx
-from config import (DEEPGRAM_API_KEY, AZURE_OPENAI_DEPLOYMENT_NAME,
-                    AZURE_OPENAI_KEY, AZURE_OPENAI_BASE_URL)
+from config import get_settings
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
 from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
@@ -17,6 +17,8 @@ from domain.plugins.deepgram_plugin import DeepgramPlugin
 from typing import List
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
 
 class ScriptItem(BaseModel):
     role: str
@@ -30,19 +32,21 @@ class MyResponseSchema(BaseModel):
 class ScriptConverterService:
 
     def __init__(self):
+        settings = get_settings()
+
         # Initialize Semantic Kernel
         self.kernel = Kernel()
 
         # Add Azure OpenAI service
         self.chat_completion = AzureChatCompletion(
             service_id="azure_gpt4",
-            deployment_name=AZURE_OPENAI_DEPLOYMENT_NAME,
-            endpoint=AZURE_OPENAI_BASE_URL,
-            api_key=AZURE_OPENAI_KEY)
+            deployment_name=settings.azure_openai_deployment_name,
+            endpoint=settings.azure_openai_base_url,
+            api_key=settings.azure_openai_key)
         self.kernel.add_service(self.chat_completion)
 
         # Add Deepgram plugin
-        self.deepgram_plugin = DeepgramPlugin(DEEPGRAM_API_KEY)
+        self.deepgram_plugin = DeepgramPlugin(settings.deepgram_api_key)
         self.kernel.add_plugin(self.deepgram_plugin, "DeepgramPlugin")
 
         # Example JSON schema that expects an object with a "script" array of objects
@@ -50,7 +54,7 @@ class ScriptConverterService:
         # Configure execution settings
         self.execution_settings = AzureChatPromptExecutionSettings(
             service_id="azure_gpt4",
-            ai_model_id=AZURE_OPENAI_DEPLOYMENT_NAME,
+            ai_model_id=settings.azure_openai_deployment_name,
             temperature=0.7,
             top_p=1.0,
             max_tokens=2000,
@@ -74,7 +78,7 @@ class ScriptConverterService:
             transcript = await self.deepgram_plugin.transcribe_audio(
                 audio_content)
 
-            print(str(transcript))
+            logger.debug("Deepgram transcript: %s", transcript)
 
             # Convert transcript to conversation format
             return await self._convert_transcript_to_conversation_format(
@@ -189,7 +193,7 @@ class ScriptConverterService:
             result = await self.chat_completion.get_chat_message_content(
                 history, settings=self.execution_settings)
 
-            print("Azure response:", result)
+            logger.debug("Azure response: %s", result)
 
             # Parse the response
             try:
@@ -1,14 +1,26 @@
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, Final, List, Mapping
+import asyncio
+import hashlib
 import json
-import aiohttp
-from datetime import datetime
+import logging
+from datetime import datetime, timezone
 from bson import ObjectId
-from config import (AZURE_OPENAI_DEPLOYMENT_NAME, AZURE_OPENAI_KEY,
-                    AZURE_OPENAI_BASE_URL, RETELL_API_KEY)
-from infrastructure.database import Database
-from api.schemas.requests import CreateSimulationRequest, UpdateSimulationRequest
+from pymongo import ReturnDocument
+from config import get_settings
+from infrastructure import database as db
+from infrastructure.http_client import get_http_session, read_json
+from infrastructure.retell_agent_pool import agent_pool_ready, take_agent_pair
+from infrastructure.retell_client import (DEFAULT_VOICE_ID, create_retell_llm,
+                                          update_retell_llm,
+                                          create_retell_agent,
+                                          update_retell_agent,
+                                          delete_retell_resources)
+from api.schemas.requests import (CreateSimulationRequest,
+                                  UpdateSimulationRequest, ScriptSentence)
 from api.schemas.responses import SimulationData
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
 from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
@@ -16,23 +28,76 @@ from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_prompt_execution_settings import (
     AzureChatPromptExecutionSettings, )
 
+logger = logging.getLogger(__name__)
+
+# Serializes a whole script in one pass instead of per-sentence .dict()
+_SCRIPT_ADAPTER = TypeAdapter(List[ScriptSentence])
+
+# Map plain request fields to simulation document fields
+_FIELD_MAP: Final[Mapping[str, str]] = MappingProxyType({
+    "name": "name",
+    "division_id": "divisionId",
+    "department_id": "departmentId",
+    "type": "type",
+    "tags": "tags",
+    "status": "status",
+    "estimated_time_to_attempt_in_mins": "estimatedTimeToAttemptInMins",
+    "key_objectives": "keyObjectives",
+    "overview_video": "overviewVideo",
+    "quick_tips": "quickTips",
+    "language": "language",
+    "mood": "mood",
+    "prompt": "prompt",
+    "simulation_completion_repetition": "simulationCompletionRepetition",
+    "simulation_max_repetition": "simulationMaxRepetition",
+    "final_simulation_score_criteria": "finalSimulationScoreCriteria",
+    "is_locked": "isLocked",
+    "version": "version",
+    "assistant_id": "assistantId",
+    "slides": "slides"
+})
+
+
+def _compile_field_copier(field_map: Mapping[str, str]):
+    """Generate a function copying each non-null mapped request field.
+
+    The body is unrolled at import into one attribute read and None check
+    per field, so updates skip the generic dict/include machinery.
+    """
+    declared = UpdateSimulationRequest.model_fields
+    lines = ["def copy_fields(request, update_doc):"]
+    for field, doc_field in field_map.items():
+        if not field.isidentifier() or field not in declared:
+            raise ValueError(f"Unknown UpdateSimulationRequest field: {field}")
+        lines.append(f"    value = request.{field}")
+        lines.append("    if value is not None:")
+        lines.append(f"        update_doc[{doc_field!r}] = value")
+    namespace = {}
+    exec(compile("\n".join(lines), "<simulation field copier>", "exec"),
+         namespace)
+    return namespace["copy_fields"]
+
+
+# Copies the plain fields of _FIELD_MAP into an update document
+_copy_plain_fields: Final = _compile_field_copier(_FIELD_MAP)
+
 
 class SimulationService:
 
     def __init__(self):
-        self.db = Database()
+        settings = get_settings()
 
         # Initialize Azure OpenAI chat completion
         self.kernel = Kernel()
         self.chat_completion = AzureChatCompletion(
             service_id="azure_gpt4",
-            deployment_name=AZURE_OPENAI_DEPLOYMENT_NAME,
-            endpoint=AZURE_OPENAI_BASE_URL,
-            api_key=AZURE_OPENAI_KEY)
+            deployment_name=settings.azure_openai_deployment_name,
+            endpoint=settings.azure_openai_base_url,
+            api_key=settings.azure_openai_key)
         self.kernel.add_service(self.chat_completion)
         self.execution_settings = AzureChatPromptExecutionSettings(
             service_id="azure_gpt4",
-            ai_model_id=AZURE_OPENAI_DEPLOYMENT_NAME,
+            ai_model_id=settings.azure_openai_deployment_name,
             temperature=0.7,
             top_p=1.0,
             max_tokens=2000)
@@ -40,9 +105,10 @@ class SimulationService:
     async def create_simulation(self,
                                 request: CreateSimulationRequest) -> Dict:
         """Create a new simulation"""
+        now = datetime.now(timezone.utc)
         try:
             # Generate prompt using Azure OpenAI
-            prompt = await self._generate_simulation_prompt(request.script)
+            prompt = await self._generate_simulation_prompt(request)
 
             # Create simulation document
             simulation_doc = {
@@ -50,11 +116,11 @@ class SimulationService:
                 "divisionId": request.division_id,
                 "departmentId": request.department_id,
                 "type": request.type,
-                "script": [s.dict() for s in request.script],
+                "script": _SCRIPT_ADAPTER.dump_python(request.script),
                 "lastModifiedBy": request.user_id,
-                "lastModified": datetime.utcnow(),
+                "lastModified": now,
                 "createdBy": request.user_id,
-                "createdOn": datetime.utcnow(),
+                "createdOn": now,
                 "status": "draft",
                 "version": 1,
                 "prompt": prompt,
@@ -62,7 +128,7 @@ class SimulationService:
             }
 
             # Insert into database
-            result = await self.db.simulations.insert_one(simulation_doc)
+            result = await db.simulations.insert_one(simulation_doc)
             return {
                 "id": str(result.inserted_id),
                 "status": "success",
@@ -76,156 +142,101 @@ class SimulationService:
     async def update_simulation(self, sim_id: str,
                                 request: UpdateSimulationRequest) -> Dict:
         """Update an existing simulation"""
+        now = datetime.now(timezone.utc)
         try:
             # Convert string ID to ObjectId
             sim_id_object = ObjectId(sim_id)
 
-            # Get existing simulation
-            existing_sim = await self.db.simulations.find_one(
-                {"_id": sim_id_object})
-            if not existing_sim:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Simulation with id {sim_id} not found")
-
-            # Build update document
-            update_doc = {}
-
-            # Helper function to add field if it exists in request
-            def add_if_exists(field_name: str,
-                              camel_case_name: str | None = None):
-                value = getattr(request, field_name)
-                if value is not None:
-                    update_doc[camel_case_name or field_name] = value
-
-            # Map request fields to document fields
-            field_mappings = {
-                "name": "name",
-                "division_id": "divisionId",
-                "department_id": "departmentId",
-                "type": "type",
-                "tags": "tags",
-                "status": "status",
-                "estimated_time_to_attempt_in_mins":
-                "estimatedTimeToAttemptInMins",
-                "key_objectives": "keyObjectives",
-                "overview_video": "overviewVideo",
-                "quick_tips": "quickTips",
-                "language": "language",
-                "mood": "mood",
-                "prompt": "prompt",
-                "simulation_completion_repetition":
-                "simulationCompletionRepetition",
-                "simulation_max_repetition": "simulationMaxRepetition",
-                "final_simulation_score_criteria":
-                "finalSimulationScoreCriteria",
-                "is_locked": "isLocked",
-                "version": "version",
-                "assistant_id": "assistantId",
-                "slides": "slides"
-            }
-
-            # Add fields from mappings
-            for field, doc_field in field_mappings.items():
-                add_if_exists(field, doc_field)
-
-            # Handle special objects
-            if request.script is not None:
-                update_doc["script"] = [s.dict() for s in request.script]
-
-            if request.lvl1 is not None:
-                update_doc["lvl1"] = {
-                    "isEnabled":
-                    request.lvl1.is_enabled,
-                    "enablePractice":
-                    request.lvl1.enable_practice,
-                    "hideAgentScript":
-                    request.lvl1.hide_agent_script,
-                    "hideCustomerScript":
-                    request.lvl1.hide_customer_script,
-                    "hideKeywordScores":
-                    request.lvl1.hide_keyword_scores,
-                    "hideSentimentScores":
-                    request.lvl1.hide_sentiment_scores,
-                    "hideHighlights":
-                    request.lvl1.hide_highlights,
-                    "hideCoachingTips":
-                    request.lvl1.hide_coaching_tips,
-                    "enablePostSimulationSurvey":
-                    request.lvl1.enable_post_simulation_survey,
-                    "aiPoweredPausesAndFeedback":
-                    request.lvl1.ai_powered_pauses_and_feedback
-                }
-
-            if request.lvl2 is not None:
-                update_doc["lvl2"] = {"isEnabled": request.lvl2.is_enabled}
-
-            if request.lvl3 is not None:
-                update_doc["lvl3"] = {"isEnabled": request.lvl3.is_enabled}
-
-            if request.simulation_scoring_metrics is not None:
-                update_doc["simulationScoringMetrics"] = {
-                    "isEnabled": request.simulation_scoring_metrics.is_enabled,
-                    "keywordScore":
-                    request.simulation_scoring_metrics.keyword_score,
-                    "clickScore":
-                    request.simulation_scoring_metrics.click_score
-                }
-
-            if request.sim_practice is not None:
-                update_doc["simPractice"] = {
-                    "isUnlimited": request.sim_practice.is_unlimited,
-                    "preRequisiteLimit":
-                    request.sim_practice.pre_requisite_limit
-                }
-
-            # Check if simulation is of type 'chat'
-            is_chat_type = existing_sim.get("type") == "chat" or (
-                request.type and request.type == "chat")
-
-            # Handle voice-related fields and LLM/Agent creation based on simulation type
-            if is_chat_type:
-                # For chat simulations, just update the prompt if provided
-                if request.prompt is not None:
-                    update_doc["prompt"] = request.prompt
-
-                # Remove voice-related fields for chat simulations
-                if "voiceId" in update_doc:
-                    del update_doc["voiceId"]
-                if "voice_speed" in update_doc:
-                    del update_doc["voice_speed"]
+            # A request that sets type "chat" needs nothing from the stored
+            # document, so its existence is checked by the update itself.
+            # Otherwise read the stored type. When a new prompt was sent and
+            # no pooled pair is ready, the Retell LLM is created concurrently
+            # with the lookup and deleted again if the simulation is missing
+            # or turns out to be a chat simulation.
+            llm_task = None
+            if request.type == "chat":
+                is_chat_type = True
             else:
-                # For non-chat simulations, handle voice-related fields
-                if request.voice_id is not None:
-                    update_doc["voiceId"] = request.voice_id
-
-                if request.voice_speed is not None:
-                    update_doc["voice_speed"] = request.voice_speed
-
-                # Create LLM and Agent if prompt is provided for non-chat simulations
-                if request.prompt is not None:
-                    # Create Retell LLM
-                    llm_response = await self._create_retell_llm(request.prompt
-                                                                 )
-                    update_doc["llmId"] = llm_response["llm_id"]
-
-                    # Create Retell Agent
-                    agent_response = await self._create_retell_agent(
-                        llm_response["llm_id"], request.voice_id
-                        or "11labs-Adrian")
-                    update_doc["agentId"] = agent_response["agent_id"]
-
-            # Add metadata
-            update_doc["lastModified"] = datetime.utcnow()
-            update_doc["lastModifiedBy"] = request.user_id
-
-            # Update database
-            result = await self.db.simulations.update_one(
-                {"_id": sim_id_object}, {"$set": update_doc})
-
-            if result.modified_count == 0:
-                raise HTTPException(status_code=500,
-                                    detail="Failed to update simulation")
+                if request.prompt is not None and not agent_pool_ready():
+                    llm_task = asyncio.create_task(
+                        create_retell_llm(request.prompt))
+                try:
+                    existing_sim = await db.simulations.find_one(
+                        {"_id": sim_id_object}, {"type": 1})
+                    if not existing_sim:
+                        raise HTTPException(
+                            status_code=404,
+                            detail=f"Simulation with id {sim_id} not found")
+
+                    # Check if simulation is of type 'chat'
+                    is_chat_type = existing_sim.get("type") == "chat"
+                except Exception:
+                    if llm_task is not None:
+                        await self._discard_llm(llm_task)
+                    raise
+
+                if is_chat_type and llm_task is not None:
+                    await self._discard_llm(llm_task)
+                    llm_task = None
+
+            # Finish the Retell LLM, then its Agent while the update document
+            # is built
+            llm_id = None
+            agent_id = None
+            agent_task = None
+            if not is_chat_type and request.prompt is not None:
+                # Prefer a pre-built pair and patch in the prompt; create a
+                # fresh LLM only when the pool is empty
+                pair = take_agent_pair() if llm_task is None else None
+                if pair is not None:
+                    llm_id, agent_id = pair
+                    agent_task = asyncio.create_task(
+                        self._prepare_pooled_agent(llm_id, agent_id,
+                                                   request.prompt,
+                                                   request.voice_id))
+                else:
+                    if llm_task is None:
+                        llm_task = asyncio.create_task(
+                            create_retell_llm(request.prompt))
+                    llm_response = await llm_task
+                    llm_id = llm_response["llm_id"]
+                    agent_task = asyncio.create_task(
+                        self._create_agent(llm_id, request.voice_id))
+
+            try:
+                update_doc = self._build_update_doc(request, is_chat_type)
+
+                # Attach LLM and Agent if prompt is provided for non-chat simulations
+                if agent_task is not None:
+                    update_doc["llmId"] = llm_id
+                    update_doc["agentId"] = await agent_task
+
+                # Nothing to change; existence was already checked by the
+                # lookup above (a request with type set always has a field
+                # to write)
+                if not update_doc:
+                    return {"id": sim_id, "status": "success", "noop": True}
+
+                # Add metadata
+                update_doc["lastModified"] = now
+                update_doc["lastModifiedBy"] = request.user_id
+
+                # Update database; None means the simulation does not exist
+                result = await db.simulations.find_one_and_update(
+                    {"_id": sim_id_object}, {"$set": update_doc},
+                    projection={"_id": 1},
+                    return_document=ReturnDocument.BEFORE)
+
+                if result is None:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Simulation with id {sim_id} not found")
+
+            except Exception:
+                # Nothing references the LLM/Agent unless the write landed
+                if agent_task is not None:
+                    await self._discard_agent(llm_id, agent_id, agent_task)
+                raise
 
             return {"id": sim_id, "status": "success"}
 
@@ -235,71 +246,109 @@ class SimulationService:
             raise HTTPException(status_code=500,
                                 detail=f"Error updating simulation: {str(e)}")
 
-    async def _create_retell_llm(self, prompt: str) -> Dict:
-        """Create a new Retell LLM"""
+    @staticmethod
+    def _build_update_doc(request: UpdateSimulationRequest,
+                          is_chat_type: bool) -> Dict:
+        """Map the fields a client sent onto simulation document fields"""
+        update_doc = {}
+
+        # Add plain fields the client sent, skipping nulls
+        _copy_plain_fields(request, update_doc)
+
+        # Handle special objects
+        if request.script is not None:
+            update_doc["script"] = _SCRIPT_ADAPTER.dump_python(request.script)
+
+        if request.lvl1 is not None:
+            update_doc["lvl1"] = request.lvl1.model_dump(by_alias=True)
+
+        # Levels 2 and 3 only persist their enabled flag
+        if request.lvl2 is not None:
+            update_doc["lvl2"] = request.lvl2.model_dump(
+                include={"is_enabled"}, by_alias=True)
+
+        if request.lvl3 is not None:
+            update_doc["lvl3"] = request.lvl3.model_dump(
+                include={"is_enabled"}, by_alias=True)
+
+        if request.simulation_scoring_metrics is not None:
+            update_doc["simulationScoringMetrics"] = (
+                request.simulation_scoring_metrics.model_dump(by_alias=True))
+
+        if request.sim_practice is not None:
+            update_doc["simPractice"] = request.sim_practice.model_dump(
+                by_alias=True)
+
+        # Handle voice-related fields based on simulation type
+        if is_chat_type:
+            # For chat simulations, just update the prompt if provided
+            if request.prompt is not None:
+                update_doc["prompt"] = request.prompt
+
+            # Remove voice-related fields for chat simulations
+            if "voiceId" in update_doc:
+                del update_doc["voiceId"]
+            if "voice_speed" in update_doc:
+                del update_doc["voice_speed"]
+        else:
+            # For non-chat simulations, handle voice-related fields
+            if request.voice_id is not None:
+                update_doc["voiceId"] = request.voice_id
+
+            if request.voice_speed is not None:
+                update_doc["voice_speed"] = request.voice_speed
+
+        return update_doc
+
+    @staticmethod
+    async def _create_agent(llm_id: str, voice_id: str | None) -> str:
+        """Create a Retell Agent for a fresh LLM and return its id"""
+        agent = await create_retell_agent(llm_id, voice_id
+                                          or DEFAULT_VOICE_ID)
+        return agent["agent_id"]
+
+    @staticmethod
+    async def _prepare_pooled_agent(llm_id: str, agent_id: str, prompt: str,
+                                    voice_id: str | None) -> str:
+        """Patch a pooled pair with the prompt and voice, return the agent id"""
+        updates = [update_retell_llm(llm_id, prompt)]
+        if voice_id and voice_id != DEFAULT_VOICE_ID:
+            updates.append(update_retell_agent(agent_id, voice_id))
+        await asyncio.gather(*updates)
+        return agent_id
+
+    @staticmethod
+    async def _discard_llm(llm_task: asyncio.Task) -> None:
+        """Delete a speculatively created Retell LLM that will not be used"""
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'Bearer {RETELL_API_KEY}',
-                    'Content-Type': 'application/json'
-                }
-
-                data = {"general_prompt": prompt}
-
-                async with session.post(
-                        'https://api.retellai.com/create-retell-llm',
-                        headers=headers,
-                        json=data) as response:
-                    if response.status != 201:
-                        raise HTTPException(
-                            status_code=response.status,
-                            detail="Failed to create Retell LLM")
-
-                    return await response.json()
-
-        except Exception as e:
-            raise HTTPException(status_code=500,
-                                detail=f"Error creating Retell LLM: {str(e)}")
-
-    async def _create_retell_agent(self, llm_id: str, voice_id: str) -> Dict:
-        """Create a new Retell Agent"""
+            llm_response = await llm_task
+        except Exception:
+            return
+        await delete_retell_resources(llm_response["llm_id"])
+
+    @staticmethod
+    async def _discard_agent(llm_id: str, agent_id: str | None,
+                             agent_task: asyncio.Task) -> None:
+        """Delete the Retell LLM/Agent prepared for an update that failed.
+
+        A pooled pair's agent id is known up front; a fresh agent's id is
+        only known if its creation finished.
+        """
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'Bearer {RETELL_API_KEY}',
-                    'Content-Type': 'application/json'
-                }
-
-                data = {
-                    "response_engine": {
-                        "llm_id": llm_id,
-                        "type": "retell-llm"
-                    },
-                    "voice_id": voice_id
-                }
-
-                async with session.post(
-                        'https://api.retellai.com/create-agent',
-                        headers=headers,
-                        json=data) as response:
-                    if response.status != 201:
-                        raise HTTPException(
-                            status_code=response.status,
-                            detail="Failed to create Retell Agent")
-
-                    return await response.json()
-
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Error creating Retell Agent: {str(e)}")
+            created_id = await agent_task
+        except Exception:
+            created_id = None
+        await delete_retell_resources(llm_id, agent_id or created_id)
 
-    async def _generate_simulation_prompt(self, script: List[Dict]) -> str:
+    async def _generate_simulation_prompt(
+            self, request: CreateSimulationRequest) -> str:
         """Generate simulation prompt using Azure OpenAI"""
         try:
-            # Convert script to conversation format for prompt
-            conversation = "\n".join(
-                [f"{s.role}: {s.script_sentence}" for s in script])
+            # Return a previously generated prompt for an identical script
+            cache_key = self._prompt_cache_key(request.script)
+            cached = await self._read_cached_prompt(cache_key)
+            if cached is not None:
+                return cached
 
             history = ChatHistory()
 
@@ -311,19 +360,59 @@ class SimulationService:
                 "conversation.")
 
             # Add user content
-            history.add_user_message(conversation)
+            history.add_user_message(request.conversation)
 
-            # Get response from Azure OpenAI
-            result = await self.chat_completion.get_chat_message_content(
-                history, settings=self.execution_settings)
+            # Stream the response from Azure OpenAI, collecting text chunks
+            # as they arrive instead of waiting for the buffered body
+            chunks = []
+            async for chunk in self.chat_completion.get_streaming_chat_message_content(
+                    history, settings=self.execution_settings):
+                if chunk is not None and chunk.content:
+                    chunks.append(chunk.content)
 
-            return str(result)
+            prompt = "".join(chunks)
+
+            # Cache the generated prompt for subsequent identical scripts
+            await self._write_cached_prompt(cache_key, prompt)
+
+            return prompt
 
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Error generating simulation prompt: {str(e)}")
 
+    @staticmethod
+    async def _read_cached_prompt(cache_key: str) -> str | None:
+        """Look up a cached prompt; cache errors count as a miss"""
+        try:
+            cached = await db.prompt_cache.find_one({"_id": cache_key})
+        except Exception:
+            logger.warning("Prompt cache read failed", exc_info=True)
+            return None
+        return cached["prompt"] if cached else None
+
+    @staticmethod
+    async def _write_cached_prompt(cache_key: str, prompt: str) -> None:
+        """Store a generated prompt; a failed write only loses the cache entry"""
+        try:
+            await db.prompt_cache.update_one(
+                {"_id": cache_key},
+                {"$set": {
+                    "prompt": prompt,
+                    "createdAt": datetime.now(timezone.utc)
+                }},
+                upsert=True)
+        except Exception:
+            logger.warning("Prompt cache write failed", exc_info=True)
+
+    @staticmethod
+    def _prompt_cache_key(script: List[ScriptSentence]) -> str:
+        """Hash the role/sentence pairs of a script into a prompt cache key"""
+        payload = json.dumps([(s.role, s.script_sentence) for s in script],
+                             separators=(',', ':'))
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
     async def start_audio_simulation_preview(self, sim_id: str,
                                              user_id: str) -> Dict:
         """Start an audio simulation preview"""
@@ -332,7 +421,7 @@ class SimulationService:
             sim_id_object = ObjectId(sim_id)
 
             # Get simulation
-            simulation = await self.db.simulations.find_one(
+            simulation = await db.simulations.find_one(
                 {"_id": sim_id_object})
             if not simulation:
                 raise HTTPException(
@@ -361,23 +450,23 @@ class SimulationService:
     async def _create_web_call(self, agent_id: str) -> Dict:
         """Create a web call using Retell API"""
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'Bearer {RETELL_API_KEY}',
-                    'Content-Type': 'application/json'
-                }
+            session = get_http_session()
+            headers = {
+                'Authorization': f'Bearer {get_settings().retell_api_key}',
+                'Content-Type': 'application/json'
+            }
 
-                data = {"agent_id": agent_id}
+            data = {"agent_id": agent_id}
 
-                async with session.post(
-                        'https://api.retellai.com/v2/create-web-call',
-                        headers=headers,
-                        json=data) as response:
-                    if response.status != 201:
-                        raise HTTPException(status_code=response.status,
-                                            detail="Failed to create web call")
+            async with session.post(
+                    'https://api.retellai.com/v2/create-web-call',
+                    headers=headers,
+                    json=data) as response:
+                if response.status != 201:
+                    raise HTTPException(status_code=response.status,
+                                        detail="Failed to create web call")
 
-                    return await response.json()
+                return await read_json(response)
 
         except Exception as e:
             raise HTTPException(status_code=500,
@@ -386,7 +475,7 @@ class SimulationService:
     async def fetch_simulations(self, user_id: str) -> List[SimulationData]:
         """Fetch all simulations"""
         try:
-            cursor = self.db.simulations.find({})
+            cursor = db.simulations.find({})
             simulations = []
 
             async for doc in cursor:
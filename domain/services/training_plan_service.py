@@ -1,7 +1,7 @@
 from typing import Dict, List
 from datetime import datetime
 from bson import ObjectId
-from infrastructure.database import Database
+from infrastructure import database as db
 from api.schemas.requests import CreateTrainingPlanRequest
 from api.schemas.responses import TrainingPlanData
 from fastapi import HTTPException
@@ -9,9 +9,6 @@ from fastapi import HTTPException
 
 class TrainingPlanService:
 
-    def __init__(self):
-        self.db = Database()
-
     async def create_training_plan(self,
                                    request: CreateTrainingPlanRequest) -> Dict:
         """Create a new training plan"""
@@ -19,14 +16,14 @@ class TrainingPlanService:
             # Validate added objects
             for obj in request.added_object:
                 if obj.type == "module":
-                    module = await self.db.modules.find_one(
+                    module = await db.modules.find_one(
                         {"_id": ObjectId(obj.id)})
                     if not module:
                         raise HTTPException(
                             status_code=404,
                             detail=f"Module with id {obj.id} not found")
                 elif obj.type == "simulation":
-                    simulation = await self.db.simulations.find_one(
+                    simulation = await db.simulations.find_one(
                         {"_id": ObjectId(obj.id)})
                     if not simulation:
                         raise HTTPException(
@@ -49,7 +46,7 @@ class TrainingPlanService:
             }
 
             # Insert into database
-            result = await self.db.training_plans.insert_one(training_plan_doc)
+            result = await db.training_plans.insert_one(training_plan_doc)
 
             return {"id": str(result.inserted_id), "status": "success"}
 
@@ -64,7 +61,7 @@ class TrainingPlanService:
                                    user_id: str) -> List[TrainingPlanData]:
         """Fetch all training plans"""
         try:
-            cursor = self.db.training_plans.find({})
+            cursor = db.training_plans.find({})
             training_plans = []
 
             async for doc in cursor:
@@ -75,18 +72,18 @@ class TrainingPlanService:
                     try:
                         if obj["type"] == "module":
                             # Get module's simulations and their times
-                            module = await self.db.modules.find_one(
+                            module = await db.modules.find_one(
                                 {"_id": ObjectId(obj["id"])})
                             if module:
                                 for sim_id in module.get("simulationIds", []):
-                                    sim = await self.db.simulations.find_one(
+                                    sim = await db.simulations.find_one(
                                         {"_id": ObjectId(sim_id)})
                                     if sim and "estimatedTimeToAttemptInMins" in sim:
                                         total_estimated_time += sim[
                                             "estimatedTimeToAttemptInMins"]
                         elif obj["type"] == "simulation":
                             # Get simulation time directly
-                            sim = await self.db.simulations.find_one(
+                            sim = await db.simulations.find_one(
                                 {"_id": ObjectId(obj["id"])})
                             if sim and "estimatedTimeToAttemptInMins" in sim:
                                 total_estimated_time += sim[
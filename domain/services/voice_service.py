@@ -1,7 +1,7 @@
 from typing import List, Dict, Any
 import aiohttp
 from fastapi import HTTPException
-from config import RETELL_API_KEY
+from config import get_settings
 
 class VoiceService:
     async def list_voices(self) -> List[Dict[str, Any]]:
@@ -9,7 +9,7 @@ class VoiceService:
         try:
             async with aiohttp.ClientSession() as session:
                 headers = {
-                    'Authorization': f'Bearer {RETELL_API_KEY}'
+                    'Authorization': f'Bearer {get_settings().retell_api_key}'
                 }
 
                 async with session.get(
@@ -1,31 +1,73 @@
+import asyncio
+import logging
 from motor.motor_asyncio import AsyncIOMotorClient
-from config import MONGO_URI, DB_NAME
-
-class Database:
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            try:
-                client = AsyncIOMotorClient(MONGO_URI)
-                db = client[DB_NAME]
-
-                # Initialize collections
-                cls._instance.users = db["users"]
-                cls._instance.assignments = db["assignments"]
-                cls._instance.training_plans = db["trainingPlans"]
-                cls._instance.modules = db["modules"]
-                cls._instance.simulations = db["simulations"]
-                cls._instance.user_sim_progress = db["userSimulationProgress"]
-                cls._instance.sim_attempts = db["simulationAttempts"]
-            except Exception as e:
-                raise ConnectionError(f"Failed to connect to MongoDB: {str(e)}")
-
-        return cls._instance
-
-    @classmethod
-    def get_instance(cls):
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
\ No newline at end of file
+from pymongo import ASCENDING, IndexModel
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Connection pool settings for the process-wide Motor client
+MONGO_POOL_OPTIONS = {
+    "maxPoolSize": 100,
+    "minPoolSize": 10,
+    "maxIdleTimeMS": 60000
+}
+
+# Longest the startup warm-up may delay serving requests
+WARM_UP_TIMEOUT_SECONDS = 3
+
+# Cached simulation prompts expire after a week
+PROMPT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Read filters used on simulations (division/department, author, agent)
+SIMULATION_INDEXES = [
+    IndexModel([("divisionId", ASCENDING), ("departmentId", ASCENDING)]),
+    IndexModel([("createdBy", ASCENDING)]),
+    IndexModel([("agentId", ASCENDING)])
+]
+
+# Outside the try so configuration errors keep raising ValueError
+_settings = get_settings()
+
+try:
+    client = AsyncIOMotorClient(_settings.mongo_uri, **MONGO_POOL_OPTIONS)
+    _db = client[_settings.db_name]
+except Exception as e:
+    raise ConnectionError(f"Failed to connect to MongoDB: {str(e)}")
+
+# Collections
+users = _db["users"]
+assignments = _db["assignments"]
+training_plans = _db["trainingPlans"]
+modules = _db["modules"]
+simulations = _db["simulations"]
+user_sim_progress = _db["userSimulationProgress"]
+sim_attempts = _db["simulationAttempts"]
+prompt_cache = _db["promptCache"]
+
+
+async def warm_mongo_pool(n: int = MONGO_POOL_OPTIONS["minPoolSize"]) -> None:
+    """Open pooled connections up front so the first request skips the handshake.
+
+    Warm-up is only an optimisation, so it is bounded by
+    WARM_UP_TIMEOUT_SECONDS: if MongoDB is slow or unreachable the error is
+    logged and startup continues, connecting lazily as before.
+    """
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*[_db.command("ping") for _ in range(n)]),
+            timeout=WARM_UP_TIMEOUT_SECONDS)
+    except Exception:
+        logger.warning("MongoDB connection pool warm-up failed",
+                       exc_info=True)
+
+
+async def ensure_indexes() -> None:
+    """Create the indexes the services rely on (idempotent)"""
+    try:
+        await asyncio.gather(
+            prompt_cache.create_index(
+                "createdAt", expireAfterSeconds=PROMPT_CACHE_TTL_SECONDS),
+            simulations.create_indexes(SIMULATION_INDEXES))
+    except Exception:
+        logger.warning("Creating MongoDB indexes failed", exc_info=True)
@@ -0,0 +1,48 @@
+from typing import Any, Optional
+import aiohttp
+import orjson
+
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+def _create_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(limit=100,
+                                     limit_per_host=30,
+                                     ttl_dns_cache=300,
+                                     keepalive_timeout=75)
+    return aiohttp.ClientSession(connector=connector,
+                                 timeout=aiohttp.ClientTimeout(total=30),
+                                 json_serialize=_json_dumps)
+
+
+def _json_dumps(obj: Any) -> str:
+    # aiohttp expects str from json_serialize; orjson emits bytes
+    return orjson.dumps(obj).decode()
+
+
+async def init_http_session() -> None:
+    """Create the shared HTTP session (called on app startup)"""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = _create_session()
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session (called on app shutdown)"""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it lazily if needed"""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = _create_session()
+    return _SESSION
+
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """Parse a response body with orjson"""
+    return orjson.loads(await response.read())
@@ -1,18 +1,15 @@
 from typing import List, Optional
 from domain.interfaces.playback_repository import IPlaybackRepository
 from domain.models.playback import SimulationAttemptModel, AttemptAnalyticsModel
-from infrastructure.database import Database
+from infrastructure import database as db
 
 class PlaybackRepository(IPlaybackRepository):
-    def __init__(self):
-        self.db = Database()
-
     async def get_attempts(self, user_id: str) -> List[SimulationAttemptModel]:
-        attempts_cursor = self.db.sim_attempts.find({"userId": user_id})
+        attempts_cursor = db.sim_attempts.find({"userId": user_id})
         return [await self._process_attempt(doc) async for doc in attempts_cursor]
 
     async def get_attempt_by_id(self, user_id: str, attempt_id: str) -> Optional[AttemptAnalyticsModel]:
-        attempt_doc = await self.db.sim_attempts.find_one({
+        attempt_doc = await db.sim_attempts.find_one({
             "_id": attempt_id,
             "userId": user_id
         })
@@ -4,12 +4,9 @@ from domain.models.training import (
     TrainingDataModel, ModuleModel, SimulationModel,
     SimulationCompletionStats, TimelyCompletionStats, TrainingStats
 )
-from infrastructure.database import Database
+from infrastructure import database as db
 
 class TrainingRepository(ITrainingRepository):
-    def __init__(self):
-        self.db = Database()
-
     async def get_training_plans(self, user_id: str) -> List[TrainingDataModel]:
         training_plan_ids = await self._get_user_assignments(user_id)
         return await self._build_training_plans(user_id, training_plan_ids)
@@ -23,22 +20,22 @@ class TrainingRepository(ITrainingRepository):
         highest_score = 0
 
         for tp_id in training_plan_ids:
-            plan = await self.db.training_plans.find_one({"_id": tp_id})
+            plan = await db.training_plans.find_one({"_id": tp_id})
             if not plan:
                 continue
 
             for module_id in plan.get("moduleIds", []):
-                module = await self.db.modules.find_one({"_id": module_id})
+                module = await db.modules.find_one({"_id": module_id})
                 if not module:
                     continue
 
                 for sim_id in module.get("simulationIds", []):
-                    simulation = await self.db.simulations.find_one({"_id": sim_id})
+                    simulation = await db.simulations.find_one({"_id": sim_id})
                     if not simulation:
                         continue
 
                     total_simulations += 1
-                    sim_progress = await self.db.user_sim_progress.find_one({
+                    sim_progress = await db.user_sim_progress.find_one({
                         "userId": user_id,
                         "simulationId": sim_id
                     })
@@ -47,7 +44,7 @@ class TrainingRepository(ITrainingRepository):
                         completed_simulations += 1
 
                         if sim_progress.get("attemptIds"):
-                            attempts_cursor = self.db.sim_attempts.find({
+                            attempts_cursor = db.sim_attempts.find({
                                 "_id": {"$in": sim_progress["attemptIds"]},
                                 "userId": user_id,
                                 "simulationId": sim_id
@@ -78,14 +75,14 @@ class TrainingRepository(ITrainingRepository):
         }
 
     async def _get_user_assignments(self, user_id: str) -> Set[str]:
-        user = await self.db.users.find_one({"_id": user_id})
+        user = await db.users.find_one({"_id": user_id})
         if not user:
             return set()
 
         division_id = user.get("divisionId")
         department_id = user.get("departmentId")
 
-        assignments_cursor = self.db.assignments.find({
+        assignments_cursor = db.assignments.find({
             "assignedItemType": "trainingPlan",
             "status": "assigned",
             "$or": [
@@ -105,7 +102,7 @@ class TrainingRepository(ITrainingRepository):
         training_plans = []
 
         for tp_id in training_plan_ids:
-            plan = await self.db.training_plans.find_one({"_id": tp_id})
+            plan = await db.training_plans.find_one({"_id": tp_id})
             if not plan:
                 continue
 
@@ -116,7 +113,7 @@ class TrainingRepository(ITrainingRepository):
             plan_total_time = 0
 
             for module_id in plan.get("moduleIds", []):
-                module = await self.db.modules.find_one({"_id": module_id})
+                module = await db.modules.find_one({"_id": module_id})
                 if not module:
                     continue
 
@@ -161,7 +158,7 @@ class TrainingRepository(ITrainingRepository):
         progress_flag = False
 
         for sim_id in sim_ids:
-            simulation = await self.db.simulations.find_one({"_id": sim_id})
+            simulation = await db.simulations.find_one({"_id": sim_id})
             if simulation:
                 sim_data = await self._build_simulation_data(simulation, user_id)
                 simulations.append(sim_data)
@@ -193,7 +190,7 @@ class TrainingRepository(ITrainingRepository):
         )
 
     async def _build_simulation_data(self, simulation: dict, user_id: str) -> SimulationModel:
-        sim_progress = await self.db.user_sim_progress.find_one({
+        sim_progress = await db.user_sim_progress.find_one({
             "userId": user_id,
             "simulationId": simulation["_id"]
         })
@@ -209,7 +206,7 @@ class TrainingRepository(ITrainingRepository):
         )
 
         if sim_progress and sim_progress.get("attemptIds"):
-            attempts_cursor = self.db.sim_attempts.find({
+            attempts_cursor = db.sim_attempts.find({
                 "_id": {"$in": sim_progress["attemptIds"]},
                 "userId": user_id,
                 "simulationId": simulation["_id"]
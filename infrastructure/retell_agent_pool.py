@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from typing import Optional, Tuple
+from infrastructure.retell_client import (DEFAULT_VOICE_ID, create_retell_llm,
+                                          create_retell_agent,
+                                          delete_retell_resources)
+
+logger = logging.getLogger(__name__)
+
+# Number of ready (llm_id, agent_id) pairs kept in reserve
+AGENT_POOL_SIZE = 10
+
+# Backoff between failed attempts to create a pair, doubling up to the max
+AGENT_POOL_RETRY_SECONDS = 5
+AGENT_POOL_MAX_RETRY_SECONDS = 300
+
+AgentPair = Tuple[str, str]
+
+
+class RetellAgentPool:
+    """Keeps pre-built Retell LLM/Agent pairs ready for simulations.
+
+    A background worker creates pairs with an empty prompt and the default
+    voice until the queue is full; callers take one and patch in their
+    prompt and voice instead of creating both from scratch.
+    """
+
+    def __init__(self, size: int = AGENT_POOL_SIZE):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._fill())
+
+    async def stop(self) -> None:
+        """Stop refilling and delete the pairs nobody took"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        cleanups = []
+        while not self._queue.empty():
+            llm_id, agent_id = self._queue.get_nowait()
+            cleanups.append(delete_retell_resources(llm_id, agent_id))
+        await asyncio.gather(*cleanups, return_exceptions=True)
+
+    def ready(self) -> bool:
+        return not self._queue.empty()
+
+    def take(self) -> Optional[AgentPair]:
+        """Return a ready pair, or None when the pool is empty"""
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    async def _fill(self) -> None:
+        delay = AGENT_POOL_RETRY_SECONDS
+        while True:
+            # Shielded so a stop() arriving mid-creation lets the pair
+            # finish; it is then deleted instead of orphaned in Retell
+            creating = asyncio.ensure_future(self._create_pair())
+            try:
+                pair = await asyncio.shield(creating)
+            except asyncio.CancelledError:
+                await self._discard_pending(creating)
+                raise
+            except Exception:
+                logger.warning(
+                    "Failed to pre-build a Retell agent; retrying in %ss",
+                    delay,
+                    exc_info=True)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, AGENT_POOL_MAX_RETRY_SECONDS)
+                continue
+            delay = AGENT_POOL_RETRY_SECONDS
+            try:
+                # Blocks while the pool is full
+                await self._queue.put(pair)
+            except asyncio.CancelledError:
+                await delete_retell_resources(*pair)
+                raise
+
+    @staticmethod
+    async def _create_pair() -> AgentPair:
+        llm = await create_retell_llm("")
+        try:
+            agent = await create_retell_agent(llm["llm_id"], DEFAULT_VOICE_ID)
+        except BaseException:
+            await delete_retell_resources(llm["llm_id"])
+            raise
+        return llm["llm_id"], agent["agent_id"]
+
+    @staticmethod
+    async def _discard_pending(creating: asyncio.Future) -> None:
+        """Wait for an interrupted pair and delete whatever it created"""
+        try:
+            llm_id, agent_id = await creating
+        except Exception:
+            # A failed pair already deleted its own LLM
+            return
+        await delete_retell_resources(llm_id, agent_id)
+
+_POOL: Optional[RetellAgentPool] = None
+
+
+async def init_agent_pool() -> None:
+    """Start filling the shared agent pool (called on app startup)"""
+    global _POOL
+    if _POOL is None:
+        _POOL = RetellAgentPool()
+    _POOL.start()
+
+
+async def close_agent_pool() -> None:
+    """Stop the shared agent pool (called on app shutdown)"""
+    global _POOL
+    if _POOL is not None:
+        await _POOL.stop()
+    _POOL = None
+
+
+def agent_pool_ready() -> bool:
+    """Whether a pre-built pair is currently waiting in the pool"""
+    return _POOL is not None and _POOL.ready()
+
+
+def take_agent_pair() -> Optional[AgentPair]:
+    """Take a pre-built (llm_id, agent_id) pair if one is ready"""
+    if _POOL is None:
+        return None
+    return _POOL.take()
@@ -0,0 +1,138 @@
+import logging
+from typing import Dict, Optional
+from fastapi import HTTPException
+from config import get_settings
+from infrastructure.http_client import get_http_session, read_json
+
+logger = logging.getLogger(__name__)
+
+RETELL_BASE_URL = "https://api.retellai.com"
+
+# Voice used when a simulation does not choose one
+DEFAULT_VOICE_ID = "11labs-Adrian"
+
+
+def _headers() -> Dict[str, str]:
+    return {
+        'Authorization': f'Bearer {get_settings().retell_api_key}',
+        'Content-Type': 'application/json'
+    }
+
+
+async def create_retell_llm(prompt: str) -> Dict:
+    """Create a new Retell LLM"""
+    try:
+        session = get_http_session()
+        data = {"general_prompt": prompt}
+
+        async with session.post(f'{RETELL_BASE_URL}/create-retell-llm',
+                                headers=_headers(),
+                                json=data) as response:
+            if response.status != 201:
+                raise HTTPException(status_code=response.status,
+                                    detail="Failed to create Retell LLM")
+
+            return await read_json(response)
+
+    except Exception as e:
+        raise HTTPException(status_code=500,
+                            detail=f"Error creating Retell LLM: {str(e)}")
+
+
+async def update_retell_llm(llm_id: str, prompt: str) -> Dict:
+    """Replace the general prompt of an existing Retell LLM"""
+    try:
+        session = get_http_session()
+        data = {"general_prompt": prompt}
+
+        async with session.patch(
+                f'{RETELL_BASE_URL}/update-retell-llm/{llm_id}',
+                headers=_headers(),
+                json=data) as response:
+            if response.status != 200:
+                raise HTTPException(status_code=response.status,
+                                    detail="Failed to update Retell LLM")
+
+            return await read_json(response)
+
+    except Exception as e:
+        raise HTTPException(status_code=500,
+                            detail=f"Error updating Retell LLM: {str(e)}")
+
+
+async def delete_retell_llm(llm_id: str) -> None:
+    """Delete a Retell LLM"""
+    session = get_http_session()
+    async with session.delete(f'{RETELL_BASE_URL}/delete-retell-llm/{llm_id}',
+                              headers=_headers()) as response:
+        response.raise_for_status()
+
+
+async def create_retell_agent(llm_id: str, voice_id: str) -> Dict:
+    """Create a new Retell Agent"""
+    try:
+        session = get_http_session()
+        data = {
+            "response_engine": {
+                "llm_id": llm_id,
+                "type": "retell-llm"
+            },
+            "voice_id": voice_id
+        }
+
+        async with session.post(f'{RETELL_BASE_URL}/create-agent',
+                                headers=_headers(),
+                                json=data) as response:
+            if response.status != 201:
+                raise HTTPException(status_code=response.status,
+                                    detail="Failed to create Retell Agent")
+
+            return await read_json(response)
+
+    except Exception as e:
+        raise HTTPException(status_code=500,
+                            detail=f"Error creating Retell Agent: {str(e)}")
+
+
+async def update_retell_agent(agent_id: str, voice_id: str) -> Dict:
+    """Change the voice of an existing Retell Agent"""
+    try:
+        session = get_http_session()
+        data = {"voice_id": voice_id}
+
+        async with session.patch(f'{RETELL_BASE_URL}/update-agent/{agent_id}',
+                                 headers=_headers(),
+                                 json=data) as response:
+            if response.status != 200:
+                raise HTTPException(status_code=response.status,
+                                    detail="Failed to update Retell Agent")
+
+            return await read_json(response)
+
+    except Exception as e:
+        raise HTTPException(status_code=500,
+                            detail=f"Error updating Retell Agent: {str(e)}")
+
+
+async def delete_retell_agent(agent_id: str) -> None:
+    """Delete a Retell Agent"""
+    session = get_http_session()
+    async with session.delete(f'{RETELL_BASE_URL}/delete-agent/{agent_id}',
+                              headers=_headers()) as response:
+        response.raise_for_status()
+
+
+async def delete_retell_resources(llm_id: str,
+                                  agent_id: Optional[str] = None) -> None:
+    """Delete an Agent and its LLM, attempting each independently"""
+    if agent_id is not None:
+        try:
+            await delete_retell_agent(agent_id)
+        except Exception:
+            logger.warning("Failed to delete Retell Agent %s",
+                           agent_id,
+                           exc_info=True)
+    try:
+        await delete_retell_llm(llm_id)
+    except Exception:
+        logger.warning("Failed to delete Retell LLM %s", llm_id, exc_info=True)
@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import FastAPI
 import uvicorn
 from api.controllers.training_controller import router as training_router
@@ -9,6 +10,9 @@ from api.controllers.module_controller import router as module_router
 from api.controllers.training_plan_controller import router as training_plan_router
 from api.controllers.list_controller import router as list_router
 from api.controllers.assignment_controller import router as assignment_router
+from infrastructure.http_client import init_http_session, close_http_session
+from infrastructure.database import warm_mongo_pool, ensure_indexes
+from infrastructure.retell_agent_pool import init_agent_pool, close_agent_pool
 
 app = FastAPI()
 
@@ -23,6 +27,22 @@ app.include_router(list_router)
 app.include_router(assignment_router)
 
 
+@app.on_event("startup")
+async def startup():
+    await init_http_session()
+    await warm_mongo_pool()
+    # Index builds can be slow on large collections; don't hold up startup
+    app.state.index_task = asyncio.create_task(ensure_indexes())
+    await init_agent_pool()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    app.state.index_task.cancel()
+    await close_agent_pool()
+    await close_http_session()
+
+
 @app.get("/")
 async def root():
     return {"message": "Hello from EverAI Simulator Backend"}